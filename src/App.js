@@ -1,5 +1,5 @@
 import React from 'react';
-import { BrowserRouter as Router, Route, Routes, useLocation } from 'react-router-dom';
+import { BrowserRouter as Router, Link, Route, Routes, useLocation } from 'react-router-dom';
 import './App.css';
 
 import Search from './Search';
@@ -21,9 +21,9 @@ const MainContent = () => {
     <div className="App">
       {showHeaderFooter && (
         <div className="flex justify-center items-center">
-          <a href="/">
+          <Link to="/">
             <img src="/images/icon.png" alt="whatisonthe.tv" className="object-contain" />
-          </a>
+          </Link>
         </div>
       )}
 
@@ -1,6 +1,9 @@
 import { useState } from 'react';
+import { Link } from 'react-router-dom';
 import { FilmIcon, UserIcon, TvIcon } from '@heroicons/react/20/solid'
 
+import fetchJson from './fetchJson';
+
 const ICONS = {
   movie: <FilmIcon aria-label='Movie' className="inline-block h-4 w-4" />,
   person: <UserIcon aria-label='Person' className="inline-block h-4 w-4" />,
@@ -14,9 +17,12 @@ const Search = () => {
   const fetchData = async () => {
     if (query.length >= 5) {
       const DOMAIN = process.env.REACT_APP_WHATISONTHETV_API_DOMAIN
-      const response = await fetch(`${DOMAIN}/shows?query=${query}`);
-      const jsonData = await response.json();
-      setData(jsonData.data);
+      try {
+        const jsonData = await fetchJson(`${DOMAIN}/shows?query=${query}`);
+        setData(jsonData.data);
+      } catch (error) {
+        console.error('Failed to search:', error);
+      }
     }
   };
 
@@ -44,7 +50,7 @@ const Search = () => {
       <ul className="grid grid-cols-2 gap-x-4 gap-y-8 sm:grid-cols-3 sm:gap-x-6 lg:grid-cols-4 xl:gap-x-8">
         {data ? data.map((item) => (
           <li key={item.id} className="relative">
-            <a href={`/media/${item.id}`} className="block">
+            <Link to={`/media/${item.id}`} className="block">
               <div className="w-[300px] h-[450px] group block w-full overflow-hidden rounded-lg bg-gray-100 focus-within:ring-2 focus-within:ring-indigo-500 focus-within:ring-offset-2 focus-within:ring-offset-gray-100 flex justify-center items-center">
                 {item.thumbnail ? (
                   <img src={item.thumbnail} alt={item.name} className="object-contain h-full w-full" />
@@ -61,7 +67,7 @@ const Search = () => {
                 <span className="text-sm font-medium text-gray-500">{item.year}{' '}</span>
                 {ICONS[item.type] || ""}
               </p>
-            </a>
+            </Link>
           </li>
         )) : null}
       </ul>
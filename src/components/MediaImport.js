@@ -1,5 +1,7 @@
 import { useState, useEffect } from 'react';
 
+import fetchJson from '../fetchJson';
+
 function MediaImport(type, id) {
   const [data, setData] = useState(null);
 
@@ -14,15 +16,14 @@ function MediaImport(type, id) {
 
     const endpoint = `${DOMAIN}/${type}/${id}`;
     try {
-      const response = await fetch(endpoint);
-      if (response.ok) {
-        const jsonData = await response.json();
-        setData(jsonData.data);
+      const jsonData = await fetchJson(endpoint);
+      setData(jsonData.data);
+    } catch (error) {
+      if (error.status) {
+        console.error('Failed to fetch data:', error.status, error.message);
       } else {
-        console.error('Failed to fetch data:', response.statusText);
+        console.error('An error occurred:', error);
       }
-    } catch (error) {
-      console.error('An error occurred:', error);
     }
   };
 
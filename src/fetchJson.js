@@ -0,0 +1,62 @@
+// Requests currently in flight, keyed by URL. Two cache misses for the same
+// URL before the first response lands (a double-clicked Search button) share
+// one request instead of both going to the network.
+const inflight = new Map();
+
+// Most recently used responses, keyed by URL. A Map keeps insertion order,
+// so re-inserting on a hit moves the entry to the end and the first key is
+// always the least recently used one. Entries expire after CACHE_TTL_MS so a
+// long-lived tab picks up content the backend has since refreshed.
+const CACHE_SIZE = 50;
+const CACHE_TTL_MS = 5 * 60 * 1000;
+const cache = new Map();
+
+function remember(url, entry) {
+  cache.delete(url);
+  cache.set(url, entry);
+  if (cache.size > CACHE_SIZE) {
+    cache.delete(cache.keys().next().value);
+  }
+}
+
+function cached(url) {
+  const entry = cache.get(url);
+  if (!entry) {
+    return undefined;
+  }
+  if (entry.expires <= Date.now()) {
+    cache.delete(url);
+    return undefined;
+  }
+  remember(url, entry);
+  return entry.jsonData;
+}
+
+async function request(url) {
+  const response = await fetch(url);
+  if (!response.ok) {
+    const error = new Error(response.statusText);
+    error.status = response.status;
+    throw error;
+  }
+  const jsonData = await response.json();
+  remember(url, { jsonData, expires: Date.now() + CACHE_TTL_MS });
+  return jsonData;
+}
+
+function fetchJson(url) {
+  const jsonData = cached(url);
+  if (jsonData !== undefined) {
+    return Promise.resolve(jsonData);
+  }
+
+  if (inflight.has(url)) {
+    return inflight.get(url);
+  }
+
+  const promise = request(url).finally(() => inflight.delete(url));
+  inflight.set(url, promise);
+  return promise;
+}
+
+export default fetchJson;
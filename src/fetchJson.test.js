@@ -0,0 +1,72 @@
+let fetchJson;
+
+const okResponse = (url) => ({
+  ok: true,
+  status: 200,
+  json: async () => ({ data: url }),
+});
+
+beforeEach(() => {
+  jest.resetModules();
+  fetchJson = require('./fetchJson').default;
+  global.fetch = jest.fn(async (url) => okResponse(url));
+});
+
+afterEach(() => {
+  jest.restoreAllMocks();
+});
+
+test('concurrent calls for the same url share one fetch', async () => {
+  const [first, second] = await Promise.all([fetchJson('/shows'), fetchJson('/shows')]);
+
+  expect(first).toEqual({ data: '/shows' });
+  expect(second).toBe(first);
+  expect(global.fetch).toHaveBeenCalledTimes(1);
+});
+
+test('a repeat call is served from the cache', async () => {
+  await fetchJson('/series/1');
+  const jsonData = await fetchJson('/series/1');
+
+  expect(jsonData).toEqual({ data: '/series/1' });
+  expect(global.fetch).toHaveBeenCalledTimes(1);
+});
+
+test('the 51st url evicts the least recently used entry', async () => {
+  for (let i = 0; i < 50; i++) {
+    await fetchJson(`/series/${i}`);
+  }
+  await fetchJson('/series/0');
+  await fetchJson('/series/50');
+  expect(global.fetch).toHaveBeenCalledTimes(51);
+
+  await fetchJson('/series/0');
+  expect(global.fetch).toHaveBeenCalledTimes(51);
+
+  await fetchJson('/series/1');
+  expect(global.fetch).toHaveBeenCalledTimes(52);
+});
+
+test('an expired entry is fetched again', async () => {
+  const now = Date.now();
+  jest.spyOn(Date, 'now').mockReturnValue(now);
+  await fetchJson('/movie/1');
+
+  Date.now.mockReturnValue(now + 6 * 60 * 1000);
+  await fetchJson('/movie/1');
+
+  expect(global.fetch).toHaveBeenCalledTimes(2);
+});
+
+test('a non-OK response rejects and is not cached', async () => {
+  global.fetch.mockResolvedValueOnce({ ok: false, status: 500, statusText: 'Server Error' });
+
+  await expect(fetchJson('/person/1')).rejects.toMatchObject({
+    message: 'Server Error',
+    status: 500,
+  });
+
+  const jsonData = await fetchJson('/person/1');
+  expect(jsonData).toEqual({ data: '/person/1' });
+  expect(global.fetch).toHaveBeenCalledTimes(2);
+});